@@ -27,6 +27,7 @@ JoMRS attributes module. Module for attributes handling.
 """
 import logging
 import pymel.core as pmc
+import maya.cmds as cmds
 import logger
 
 ##########################################################
@@ -35,6 +36,9 @@ import logger
 
 _LOGGER = logging.getLogger(__name__ + ".py")
 
+# The default channels for locking and hiding.
+_LOCK_ATTRS = ("tx", "ty", "tz", "ro", "rx", "ry", "rz", "sx", "sy", "sz")
+
 ##########################################################
 # FUNCTIONS
 ##########################################################
@@ -318,25 +322,33 @@ def lock_and_hide_attributes(node, lock=True, hide=True, attributes=None):
     Lock and hide a attribute of the node.
     In Default it will lock and hide the default channels.
     Args:
-            node(dagNode): The node the attribute belongs to.
+            node(dagNode): The node the attribute belongs to. Or its
+            name.
             lock(bool): Lock/unlock the attribute.
             hide(bool): Hide/Unhide the attribute.
             attributes(list of str): The list with attributes to lock/hide
     Return:
-            list: The locked attributes.
+            list: The locked plug names on the full path of the node.
     """
-    default_attr = ["tx", "ty", "tz", "ro", "rx", "ry", "rz", "sx", "sy", "sz"]
     result = []
     if attributes:
         if not isinstance(attributes, list):
             attributes = [attributes]
     else:
-        attributes = default_attr
+        attributes = _LOCK_ATTRS
+    # The plugs are built on the full path. So they are unique even if
+    # other nodes share the short name.
+    if isinstance(node, pmc.nt.DagNode):
+        node_name = node.longName()
+    else:
+        node_name = cmds.ls(node, long=True)[0]
     for attr_ in attributes:
-        node.attr(attr_).set(lock=lock)
+        plug = "{}.{}".format(node_name, attr_)
         if hide:
-            node.attr(attr_).set(keyable=False, channelBox=False)
-        result.append(node.attr(attr_))
+            cmds.setAttr(plug, lock=lock, keyable=False, channelBox=False)
+        else:
+            cmds.setAttr(plug, lock=lock)
+        result.append(plug)
     return result
 
 
@@ -433,15 +433,20 @@ class MainBuild(object):
                     comp_container_instance.get_input_ws_matrix_offset_nd()
                 )
                 # For each node in rig_ws_offset_nd create a matrix constraint.
-                for index, node in enumerate(rig_ws_offset_nd):
-                    mul_ma_nd = mayautils.create_matrix_constraint(
-                        source=node,
-                        target=comp_container_input,
-                        maintain_offset=True,
-                        target_plug="{}[{}]".format(
-                            constants.INPUT_WS_PORT_NAME, str(index)
-                        ),
-                    )
+                mul_ma_nds = mayautils.create_matrix_constraints(
+                    [
+                        {
+                            "source": node,
+                            "target": comp_container_input,
+                            "maintain_offset": True,
+                            "target_plug": "{}[{}]".format(
+                                constants.INPUT_WS_PORT_NAME, str(index)
+                            ),
+                        }
+                        for index, node in enumerate(rig_ws_offset_nd)
+                    ]
+                )
+                for mul_ma_nd in mul_ma_nds:
                     decomp_nd = mul_ma_nd.matrixSum.connections()
                     offset_nd = mul_ma_nd.matrixIn[0].connections()
                     matrix_constraint_nodes = [mul_ma_nd, decomp_nd, offset_nd]
@@ -563,14 +568,20 @@ class MainBuild(object):
             data file in the rig package temp folder as backup.
 
         """
-        self.get_meta_data(rig_meta_data, operator_meta_data)
-        self.process_component_parenting_data(component_parenting_data)
-        self.build_rig_container()
-        self.build_components()
-        self.connect_components()
-        self.connect_components_inputs_with_components_rig_offsets_grp()
-        self.parent_components()
-        self.arrange_deformation_hierarchy()
+        # The rig is build from the meta data. So none of the building steps
+        # has to be recorded in the undo queue or drawn in between. The
+        # evaluation graph is rebuilt once after the build and not for
+        # each step.
+        with mayautils.no_undo(), mayautils.suspend_refresh():
+            with mayautils.dg_evaluation():
+                self.get_meta_data(rig_meta_data, operator_meta_data)
+                self.process_component_parenting_data(component_parenting_data)
+                self.build_rig_container()
+                self.build_components()
+                self.connect_components()
+                self.connect_components_inputs_with_components_rig_offsets_grp()
+                self.parent_components()
+                self.arrange_deformation_hierarchy()
         if save_meta_data_json:
             self.save_meta_data_as_json()
 
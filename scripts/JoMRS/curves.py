@@ -120,7 +120,7 @@ class ControlCurves(object):
                 )
         if match:
             if isinstance(match, pmc.datatypes.Matrix) is False:
-                pmc.delete(pmc.parentConstraint(match, self.control, mo=False))
+                utils.snap_transform(self.control, match)
             else:
                 self.control.setMatrix(match, worldSpace=True)
         if color_index:
@@ -1484,10 +1484,11 @@ class CurvedCircleControl(ControlCurves):
             ch=0,
             n=name,
         )[0]
+        # Set each control point as one compound value instead of one set
+        # per axis.
+        shape = circle.getShape()
         for v in values:
-            circle.getShape().controlPoints[v["cv"]].xValue.set(v["value"][0])
-            circle.getShape().controlPoints[v["cv"]].yValue.set(v["value"][1])
-            circle.getShape().controlPoints[v["cv"]].zValue.set(v["value"][2])
+            shape.controlPoints[v["cv"]].set(v["value"])
         return circle
 
 
@@ -1541,14 +1542,12 @@ class DoubleCurvedCircleControl(ControlCurves):
             ch=0,
             n=name,
         )[0]
-        for v in values0:
-            circle0.getShape().controlPoints[v["cv"]].xValue.set(v["value"][0])
-            circle0.getShape().controlPoints[v["cv"]].yValue.set(v["value"][1])
-            circle0.getShape().controlPoints[v["cv"]].zValue.set(v["value"][2])
-        for v in values1:
-            circle1.getShape().controlPoints[v["cv"]].xValue.set(v["value"][0])
-            circle1.getShape().controlPoints[v["cv"]].yValue.set(v["value"][1])
-            circle1.getShape().controlPoints[v["cv"]].zValue.set(v["value"][2])
+        # Set each control point as one compound value instead of one set
+        # per axis.
+        for circle, values in ((circle0, values0), (circle1, values1)):
+            shape = circle.getShape()
+            for v in values:
+                shape.controlPoints[v["cv"]].set(v["value"])
         pmc.parent(circle1.getShape(), circle0, r=True, shape=True)
         pmc.delete(circle1)
         return circle0
@@ -1658,24 +1657,16 @@ class RotateAxesControl:
             scale=scale,
             color_index=14,
         )[0]
-        for v in arrowValue0:
-            arrow0[-1].getShape().controlPoints[v["cv"]].xValue.set(
-                v["value"][0]
-            )
-            arrow0[-1].getShape().controlPoints[v["cv"]].yValue.set(
-                v["value"][1]
-            )
-            arrow0[-1].getShape().controlPoints[v["cv"]].zValue.set(
-                v["value"][2]
-            )
-        for v in arrowValue1:
-            arrow1.getShape().controlPoints[v["cv"]].xValue.set(v["value"][0])
-            arrow1.getShape().controlPoints[v["cv"]].yValue.set(v["value"][1])
-            arrow1.getShape().controlPoints[v["cv"]].zValue.set(v["value"][2])
-        for v in arrowValue2:
-            arrow2.getShape().controlPoints[v["cv"]].xValue.set(v["value"][0])
-            arrow2.getShape().controlPoints[v["cv"]].yValue.set(v["value"][1])
-            arrow2.getShape().controlPoints[v["cv"]].zValue.set(v["value"][2])
+        # Set each control point as one compound value instead of one set
+        # per axis.
+        for arrow, values in (
+            (arrow0[-1], arrowValue0),
+            (arrow1, arrowValue1),
+            (arrow2, arrowValue2),
+        ):
+            shape = arrow.getShape()
+            for v in values:
+                shape.controlPoints[v["cv"]].set(v["value"])
         pmc.parent(arrow1.getShape(), arrow0[-1], r=True, shape=True)
         pmc.parent(arrow2.getShape(), arrow0[-1], r=True, shape=True)
         pmc.delete(arrow1, arrow2)
@@ -1863,7 +1854,7 @@ def cubic_curve(
     result = pmc.curve(**data)
     attributes.lock_and_hide_attributes(result)
     for y in range(len(driver_nodes)):
-        decomp = pmc.creatNode("decomposeMatrix", n=name + "_DEMAND")
+        decomp = pmc.createNode("decomposeMatrix", n=name + "_DEMAND")
         driver_nodes[y].worldMatrix[0].connect(decomp.inputMatrix)
         decomp.outputTranslate.connect(result.controlPoints[y])
     if template:
@@ -1895,12 +1886,14 @@ def mirror_curve(
         dupl_curve = pmc.duplicate(curve, rr=True)[0]
         children = utils.descendants(dupl_curve)
         for node in children:
+            # search_and_replace returns None if the search string is not
+            # in the name. Then the name is kept.
             name = strings.search_and_replace(
                 string=str(node), search=search, replace=replace
-            )[0]
+            ) or str(node)
             name = strings.string_checkup(name)
             pmc.rename(node, name)
-        mirror_grp = pmc.creatNode("transform", n="M_temp_mirror_0_GRP")
+        mirror_grp = pmc.createNode("transform", n="M_temp_mirror_0_GRP")
         mirror_grp.addChild(dupl_curve)
         mirror_grp.scaleX.set(-1)
         pmc.parent(dupl_curve, w=True)
@@ -35,6 +35,9 @@ to create maya behaviours.
 
 import pymel.core as pmc
 import pymel.core.datatypes as dt
+import maya.cmds as cmds
+from maya.api import OpenMaya as om2
+from maya.api import OpenMayaAnim as oma2
 import attributes
 import strings
 import logging
@@ -42,6 +45,8 @@ import logger
 import constants
 import meta
 import uuid
+import math
+import contextlib
 
 ##########################################################
 # GLOBAL
@@ -49,12 +54,356 @@ import uuid
 
 _LOGGER = logging.getLogger(__name__ + ".py")
 
+# The constraint output and constrained channel plugs.
+_CONSTRAINT_TRANSLATE = ("constraintTranslate", "translate")
+_CONSTRAINT_ROTATE = ("constraintRotate", "rotate")
+_CONSTRAINT_SCALE = ("constraintScale", "scale")
+
+# All axes are skipped on constraint creation. The wanted axes are connected
+# afterwards. The skip flags are multi use flags. So it has to be a list.
+_SKIP_AXES = ["x", "y", "z"]
+
+# The constraint command, the constrained channels and the skip flags
+# for each constraint typ.
+_CONSTRAINT_TYPES = {
+    "parent": (
+        cmds.parentConstraint,
+        (_CONSTRAINT_TRANSLATE, _CONSTRAINT_ROTATE),
+        {"skipTranslate": _SKIP_AXES, "skipRotate": _SKIP_AXES},
+    ),
+    "point": (
+        cmds.pointConstraint,
+        (_CONSTRAINT_TRANSLATE,),
+        {"skip": _SKIP_AXES},
+    ),
+    "orient": (
+        cmds.orientConstraint,
+        (_CONSTRAINT_ROTATE,),
+        {"skip": _SKIP_AXES},
+    ),
+    "scale": (
+        cmds.scaleConstraint,
+        (_CONSTRAINT_SCALE,),
+        {"skip": _SKIP_AXES},
+    ),
+}
+
+# Cache for the inverse local aim frames of aim and up axes combinations.
+_LOCAL_AXES_MATRICES = {}
+
+# The pivot and rotate order plugs of a constraint.
+_CONSTRAINT_PIVOT_PLUGS = (
+    "constraintRotatePivot",
+    "constraintRotateTranslate",
+    "constraintRotateOrder",
+)
+
+# The decomposeMatrix outputs and the constrained channels for the
+# translation, rotation and scale of a matrix constraint. The scale is
+# connected per axis. So a caller can override a single axis, like the
+# negated scale of mirrored components.
+_MATRIX_CONSTRAINT_CHANNELS = (
+    (("outputTranslate", "translate"),),
+    (("outputRotate", "rotate"),),
+    (
+        ("outputScaleX", "scaleX"),
+        ("outputScaleY", "scaleY"),
+        ("outputScaleZ", "scaleZ"),
+    ),
+)
+
+# The valid side prefixes of node names.
+_VALID_SIDES = ("L", "R", "M")
+
+# The radius and override color of each joint typ.
+_JOINT_PRESETS = {
+    "BND": (1, 17),
+    "DRV": (2.5, 18),
+    "FK": (1.5, 4),
+    "IK": (2, 6),
+}
+
+# The enum values of the motion path axes and world up types and the
+# default world up vector of a new motion path node.
+_MOTION_PATH_AXES = {"x": 0, "y": 1, "z": 2}
+_MOTION_PATH_DEFAULT_UP_VECTOR = (0, 1, 0)
+_MOTION_PATH_WORLD_UP_TYPES = {
+    "sceneUp": 0,
+    "objectUp": 1,
+    "objectRotationUp": 2,
+    "vector": 3,
+    "normal": 4,
+}
+
+# The aim constraint world up types which need a world up object.
+_AIM_WORLD_UP_OBJECT_TYPES = ("object", "objectrotation")
+
+# The depth of the nested suspend_refresh contexts. The refresh command is
+# not queryable. So only the outermost context resumes the refresh.
+_REFRESH_SUSPEND = {"depth": 0}
+
 ##########################################################
 # FUNCTIONS
 ##########################################################
 
 
-def create_buffer_grp(node, name=None):
+def get_dag_path_(node):
+    """
+    Get the api 2.0 dag path of a node.
+    Args:
+            node(dagnode): The dag node or its name.
+    Return:
+            om2.MDagPath: The dag path of the node.
+    """
+    sel = om2.MSelectionList()
+    sel.add(str(node))
+    return sel.getDagPath(0)
+
+
+def get_plug_(plug):
+    """
+    Get the api 2.0 plug by its name.
+    Args:
+            plug(str): The plug name. Example: "node.attribute".
+            Api 2.0 plugs will be passed through.
+    Return:
+            om2.MPlug: The plug.
+    """
+    if isinstance(plug, om2.MPlug):
+        return plug
+    sel = om2.MSelectionList()
+    sel.add(plug)
+    return sel.getPlug(0)
+
+
+def connect_plugs_(connections, force=False, modifier=None):
+    """
+    Connect plugs in one DG modification.
+    Args:
+            connections(list): Tuples of source and destination plug names
+            or api 2.0 plugs.
+            force(bool): Replace existing incoming connections of the
+            destination plugs and their child plugs.
+            modifier(om2.MDGModifier): Modifier to collect the connections.
+            If passed the caller has to execute it.
+    Return:
+            om2.MDGModifier: The modifier with the connections.
+    """
+    execute = modifier is None
+    if execute:
+        modifier = om2.MDGModifier()
+    for source_plug, destination_plug in connections:
+        destination_plug = get_plug_(destination_plug)
+        if force:
+            disconnect_input_plug_(destination_plug, modifier=modifier)
+        modifier.connect(get_plug_(source_plug), destination_plug)
+    if execute:
+        modifier.doIt()
+    return modifier
+
+
+def disconnect_input_plug_(plug, modifier=None):
+    """
+    Disconnect the incoming connections of a plug and its child plugs.
+    Plugs without incoming connection will be skipped.
+    Args:
+            plug(str or om2.MPlug): The plug to disconnect.
+            modifier(om2.MDGModifier): Modifier to collect the
+            disconnections. If passed the caller has to execute it.
+    Return:
+            om2.MDGModifier: The modifier with the disconnections.
+    """
+    execute = modifier is None
+    if execute:
+        modifier = om2.MDGModifier()
+    plug = get_plug_(plug)
+    plugs = [plug]
+    if plug.isCompound:
+        plugs.extend(plug.child(index) for index in range(plug.numChildren()))
+    for plug in plugs:
+        source_plug = plug.source()
+        if not source_plug.isNull:
+            modifier.disconnect(source_plug, plug)
+    if execute:
+        modifier.doIt()
+    return modifier
+
+
+def node_names_(nodes):
+    """
+    Get the names of one or more nodes for maya.cmds calls.
+    Args:
+            nodes(list or dagnode): The nodes.
+    Return:
+            list: The node names.
+    """
+    if not isinstance(nodes, (list, tuple)):
+        nodes = [nodes]
+    return [str(node) for node in nodes]
+
+
+def find_plug_(node_fn, attribute, index=None):
+    """
+    Find a plug of a api 2.0 function set node.
+    Args:
+            node_fn(om2.MFnDependencyNode): The node function set.
+            attribute(str): The attribute name.
+            index(int): The logical index of a array attribute.
+    Return:
+            om2.MPlug: The plug.
+    """
+    plug = node_fn.findPlug(attribute, False)
+    if index is not None:
+        plug = plug.elementByLogicalIndex(index)
+    return plug
+
+
+def parent_node_(node, parent):
+    """
+    Parent a node in world space through maya.cmds. Nodes which are
+    already a child of the parent are skipped like the pymel parent
+    command does.
+    Args:
+            node(dagnode): The node to parent.
+            parent(dagnode): The new parent.
+    """
+    node_name = str(node)
+    parent_name = get_dag_path_(parent).fullPathName()
+    current_parent = cmds.listRelatives(node_name, parent=True, fullPath=True)
+    if current_parent != [parent_name]:
+        cmds.parent(node_name, parent_name)
+
+
+def create_dag_node_(typ, name, parent=None):
+    """
+    Create a dag node with maya.cmds.
+    Args:
+            typ(str): The node type.
+            name(str): The name of the node.
+            parent(str): The parent of the node. By default it is created
+            in the world.
+    Return:
+            str: The full path of the node.
+    """
+    flags = {"n": name, "skipSelect": True}
+    if parent:
+        flags["parent"] = parent
+    # The returned name is only unique in the scene. So the full path is
+    # resolved by ls and not joined by hand.
+    return cmds.ls(cmds.createNode(typ, **flags), long=True)[0]
+
+
+def snap_transform(node, target):
+    """
+    Snap a transform node onto the world translation and rotation of a
+    target. The scale of the node is kept. Same result as a deleted
+    parentConstraint without maintain offset.
+    Args:
+            node(dagnode): The transform to snap.
+            target(dagnode): The transform to match.
+    Return:
+            tuple: The snapped node.
+    """
+    node_name = str(node)
+    transformation = om2.MTransformationMatrix(
+        om2.MMatrix(cmds.xform(str(target), q=True, ws=True, m=True))
+    )
+    node_transformation = om2.MTransformationMatrix(
+        om2.MMatrix(cmds.xform(node_name, q=True, ws=True, m=True))
+    )
+    transformation.setScale(
+        node_transformation.scale(om2.MSpace.kWorld), om2.MSpace.kWorld
+    )
+    cmds.xform(node_name, ws=True, m=list(transformation.asMatrix()))
+    return node
+
+
+@contextlib.contextmanager
+def no_undo():
+    """
+    Context manager which turns off the undo queue without flushing it.
+    For batch operations like the rig build where recording each single
+    step is not needed. The previous undo state is restored at the end.
+    The wrapped operations can not be undone. So the caller should only
+    use it for steps which are rebuild from scratch anyway.
+    Example:
+            >>> with no_undo():
+            >>>     build_rig()
+    """
+    state = cmds.undoInfo(query=True, state=True)
+    cmds.undoInfo(stateWithoutFlush=False)
+    try:
+        yield
+    finally:
+        cmds.undoInfo(stateWithoutFlush=state)
+
+
+@contextlib.contextmanager
+def undo_chunk(name):
+    """
+    Context manager which records the wrapped commands as one undo chunk.
+    So a builder can be undone with a single undo step. Edits through api
+    modifiers are not part of the undo queue. So the wrapped builders
+    should only edit the scene with commands.
+    Args:
+            name(str): The name of the undo chunk.
+    Example:
+            >>> with undo_chunk("convert_to_skeleton"):
+            >>>     build_skeleton()
+    """
+    cmds.undoInfo(openChunk=True, chunkName=name)
+    try:
+        yield
+    finally:
+        cmds.undoInfo(closeChunk=True)
+
+
+@contextlib.contextmanager
+def suspend_refresh():
+    """
+    Context manager which suspends the viewport refresh. So a batch of DG
+    edits is drawn once at the end and not after each single edit. Nested
+    contexts keep the refresh suspended until the outermost one ends.
+    Example:
+            >>> with suspend_refresh():
+            >>>     build_rig()
+    """
+    if not _REFRESH_SUSPEND["depth"]:
+        cmds.refresh(suspend=True)
+    _REFRESH_SUSPEND["depth"] += 1
+    try:
+        yield
+    finally:
+        _REFRESH_SUSPEND["depth"] -= 1
+        if not _REFRESH_SUSPEND["depth"]:
+            cmds.refresh(suspend=False)
+
+
+@contextlib.contextmanager
+def dg_evaluation():
+    """
+    Context manager which switches the evaluation manager to DG mode.
+    So bulk node creation and setAttr calls do not invalidate and rebuild
+    the evaluation graph after each single edit. Each mode change rebuilds
+    the graph itself. So the rig build enters it once, and the helpers
+    which use it do not switch anything if DG mode is already on.
+    The previous mode is restored at the end.
+    Example:
+            >>> with no_undo(), suspend_refresh(), dg_evaluation():
+            >>>     build_rig()
+    """
+    mode = cmds.evaluationManager(query=True, mode=True)[0]
+    if mode == "off":
+        yield
+        return
+    cmds.evaluationManager(mode="off")
+    try:
+        yield
+    finally:
+        cmds.evaluationManager(mode=mode)
+
+
+def create_buffer_grp(node, name=None, matrix=None):
     """
     Create a buffer transform for transform node and parent
     the node under buffer group.
@@ -62,20 +411,29 @@ def create_buffer_grp(node, name=None):
     under the buffer and the buffer under the parent.
     Args:
             node(dagnode): A transform node.
+            name(str): The name of the buffer. By default it is the node
+            name.
+            matrix(list): The world matrix of the node. If the caller
+            knows it already. By default it is queried from the node.
     Return:
             tuple: The created buffer dagnode.
     """
-    parent = node.getParent()
-    if not name:
+    node_name = get_dag_path_(node).fullPathName()
+    if name:
         name = name + "_buffer_GRP"
     else:
-        name = str(node) + "_buffer_GRP"
-    buffer_grp = pmc.createNode("transform", n=name)
-    buffer_grp.setMatrix(node.getMatrix(worldSpace=True), worldSpace=True)
-    buffer_grp.addChild(node)
-    if parent:
-        parent.addChild(buffer_grp)
-    return buffer_grp
+        name = node.nodeName() + "_buffer_GRP"
+    # Create the buffer directly under the parent of the node. So only the
+    # node has to be parented afterwards.
+    parent = cmds.listRelatives(node_name, parent=True, fullPath=True)
+    buffer_name = create_dag_node_(
+        "transform", name, parent[0] if parent else None
+    )
+    if matrix is None:
+        matrix = cmds.xform(node_name, q=True, ws=True, m=True)
+    cmds.xform(buffer_name, ws=True, m=matrix)
+    cmds.parent(node_name, buffer_name)
+    return pmc.PyNode(buffer_name)
 
 
 def space_locator_on_position(node, buffer_grp=True):
@@ -87,15 +445,42 @@ def space_locator_on_position(node, buffer_grp=True):
     Return:
             list: The buffer group, the locator node.
     """
-    result = []
     name = strings.string_checkup(str(node) + "_0_LOC", _LOGGER)
-    loc = pmc.spaceLocator(n=name)
-    loc.setMatrix(node.getMatrix(worldSpace=True), worldSpace=True)
-    result.append(loc)
+    loc_name = cmds.ls(cmds.spaceLocator(n=name)[0], long=True)[0]
+    # The locator gets the matrix of the node. So the buffer can reuse it
+    # without a second world matrix query.
+    matrix = cmds.xform(str(node), q=True, ws=True, m=True)
+    cmds.xform(loc_name, ws=True, m=matrix)
+    loc = pmc.PyNode(loc_name)
     if buffer_grp:
-        buffer_grp = create_buffer_grp(loc)
-        result.insert(0, buffer_grp)
-    return result
+        return [create_buffer_grp(loc, matrix=matrix), loc]
+    return [loc]
+
+
+def ik_handle_values_(ik_handle, snap, sticky, weight, po_weight):
+    """
+    Collect the values of a new IK handle in one modifier. The handle is
+    hidden.
+    Args:
+            ik_handle(dagnode): The IK handle.
+            snap(bool): Enable/Disalbe snap option of the IK.
+            sticky(bool): Enable/Disalbe stickieness option of the IK.
+            weight(float): Set handle weight.
+            po_weight(float): Set the poleVector weight.
+    Return:
+            om2.MDGModifier: The modifier with the values. The caller has
+            to execute it.
+    """
+    handle_fn = om2.MFnDependencyNode(get_dag_path_(ik_handle).node())
+    modifier = om2.MDGModifier()
+    modifier.newPlugValueBool(find_plug_(handle_fn, "visibility"), False)
+    if snap is False:
+        modifier.newPlugValueBool(find_plug_(handle_fn, "snapEnable"), False)
+    if sticky:
+        modifier.newPlugValueInt(find_plug_(handle_fn, "stickiness"), 1)
+    modifier.newPlugValueDouble(find_plug_(handle_fn, "weight"), weight)
+    modifier.newPlugValueDouble(find_plug_(handle_fn, "poWeight"), po_weight)
+    return modifier
 
 
 def create_spline_ik(
@@ -127,46 +512,52 @@ def create_spline_ik(
             list(dagnodes): the ik Handle, the effector,
             the spline ik curve shape.
     """
-    result = []
-    data = {}
-    name = strings.string_checkup(name, _LOGGER)
-    data["n"] = name
-    data["solver"] = "ikSplineSolver"
-    data["createCurve"] = False
-    data["sj"] = start_jnt
-    data["ee"] = end_jnt
-    if curve is not None:
-        data["c"] = curve
-    else:
-        data["createCurve"] = True
-    ik_handle = pmc.ikHandle(**data)
-    pmc.rename(ik_handle[1], str(end_jnt) + "_EFF")
-    result.extend(ik_handle)
-    if curve:
-        pmc.rename(curve, str(curve) + "_CRV")
-        shape = curve.getShape()
-        result.append(shape)
-    else:
-        pmc.rename(ik_handle[2], str(ik_handle[2] + "_CRV"))
-        shape = pmc.PyNode(ik_handle[2]).getShape()
-        result[2] = shape
-    if parent:
-        parent.addChild(result[0])
-    if curve_parent:
-        curve_parent.addChild(result[2].getParent())
-    result[2].getParent().visibility.set(0)
-    attributes.lock_and_hide_attributes(result[2].getParent())
-    result[0].visibility.set(0)
-    if snap is False:
-        result[0].snapEnable.set(0)
-    if sticky:
-        result[0].stickiness.set(1)
-    result[0].attr("weight").set(weight)
-    result[0].attr("po_weight").set(po_weight)
-    logger.log(
-        level="info", message='Spline IK "' + name + '" created', logger=_LOGGER
-    )
-    return result
+    with suspend_refresh(), dg_evaluation():
+        result = []
+        data = {}
+        name = strings.string_checkup(name, _LOGGER)
+        data["n"] = name
+        data["solver"] = "ikSplineSolver"
+        data["createCurve"] = False
+        data["sj"] = start_jnt
+        data["ee"] = end_jnt
+        if curve is not None:
+            data["c"] = curve
+        else:
+            data["createCurve"] = True
+        ik_handle = pmc.ikHandle(**data)
+        # The handle is named at creation. The effector and curve can not be
+        # named by the ikHandle command. The PyNodes stay valid after the
+        # rename through cmds.
+        cmds.rename(str(ik_handle[1]), "{}_EFF".format(end_jnt))
+        result.extend(ik_handle)
+        if curve:
+            cmds.rename(str(curve), "{}_CRV".format(curve))
+            result.append(curve.getShape())
+        else:
+            cmds.rename(str(ik_handle[2]), "{}_CRV".format(ik_handle[2]))
+            result[2] = ik_handle[2].getShape()
+        curve_transform = result[2].getParent()
+        if parent:
+            parent_node_(result[0], parent)
+        if curve_parent:
+            parent_node_(curve_transform, curve_parent)
+        attributes.lock_and_hide_attributes(curve_transform)
+        # All value changes of the handle and the curve in one DG modification.
+        modifier = ik_handle_values_(
+            result[0], snap, sticky, weight, po_weight
+        )
+        modifier.newPlugValueBool(
+            get_plug_("{}.visibility".format(curve_transform.longName())),
+            False,
+        )
+        modifier.doIt()
+        logger.log(
+            level="info",
+            message='Spline IK "' + name + '" created',
+            logger=_LOGGER,
+        )
+        return result
 
 
 def create_IK(
@@ -203,28 +594,48 @@ def create_IK(
     data["sj"] = start_jnt
     data["ee"] = end_jnt
     ik_handle = pmc.ikHandle(**data)
-    pmc.rename(ik_handle[1], str(end_jnt) + "_EFF")
+    cmds.rename(str(ik_handle[1]), "{}_EFF".format(end_jnt))
     if parent:
-        parent.addChild(ik_handle[0])
-    ik_handle[0].visibility.set(0)
-    if snap is False:
-        ik_handle[0].snapEnable.set(0)
-    if sticky:
-        ik_handle[0].stickiness.set(1)
-    ik_handle[0].attr("weight").set(weight)
-    ik_handle[0].attr("po_weight").set(po_weight)
+        parent_node_(ik_handle[0], parent)
+    ik_handle_values_(ik_handle[0], snap, sticky, weight, po_weight).doIt()
     logger.log(
         level="info", message=solver + ' "' + name + '" created', logger=_LOGGER
     )
     return ik_handle
 
 
+def constraint_channel_plugs_(constraint, source, channels, axes):
+    """
+    Get the constraint output and source channel plugs of each axis. The
+    plugs are found on the function sets of the two nodes. So each node
+    name is resolved only once.
+    Args:
+            constraint(str): The constraint name.
+            source(str): The constrained node name.
+            channels(tuple): Pairs of constraint and source attribute names.
+            axes(list): The axes as strings.
+    Return:
+            list: Tuples of constraint and source api 2.0 plugs.
+    """
+    constraint_fn = om2.MFnDependencyNode(get_dag_path_(constraint).node())
+    source_fn = om2.MFnDependencyNode(get_dag_path_(source).node())
+    upper_axes = [ax.upper() for ax in axes]
+    return [
+        (
+            find_plug_(constraint_fn, constraint_attr + ax),
+            find_plug_(source_fn, source_attr + ax),
+        )
+        for constraint_attr, source_attr in channels
+        for ax in upper_axes
+    ]
+
+
 def constraint(
     typ="parent",
     source=None,
     target=None,
     maintain_offset=True,
-    axes=["X", "Y", "Z"],
+    axes=("X", "Y", "Z"),
 ):
     """
     Create contraints. By default it creates a parentConstraint
@@ -240,47 +651,22 @@ def constraint(
             list: The created constraint.
     """
     result = []
-    skip_axes = ["x", "y", "z"]
-    if typ == "parent":
-        result = pmc.parentConstraint(
-            target,
-            source,
-            mo=maintain_offset,
-            skipRotate=skip_axes,
-            skipTranslate=skip_axes,
-        )
-        for ax in axes:
-            result.attr("constraintTranslate" + ax.upper()).connect(
-                source.attr("translate" + ax.upper())
-            )
-            result.attr("constraintRotate" + ax.upper()).connect(
-                source.attr("rotate" + ax.upper())
-            )
-    if typ == "point":
-        result = pmc.pointConstraint(
-            target, source, mo=maintain_offset, skip=skip_axes
-        )
-        for ax in axes:
-            result.attr("constraintTranslate" + ax.upper()).connect(
-                source.attr("translate" + ax.upper())
-            )
-    if typ == "orient":
-        result = pmc.orientConstraint(
-            target, source, mo=maintain_offset, skip=skip_axes
-        )
-        for ax in axes:
-            result.attr("constraintRotate" + ax.upper()).connect(
-                source.attr("rotate" + ax.upper())
-            )
-    if typ == "scale":
-        result = pmc.scaleConstraint(
-            target, source, mo=maintain_offset, skip=skip_axes
+    if typ not in _CONSTRAINT_TYPES:
+        logger.log(
+            level="error",
+            message='"{}" is not a valid constraint typ'.format(typ),
+            logger=_LOGGER,
         )
-        for ax in axes:
-            result.attr("constraintScale" + ax.upper()).connect(
-                source.attr("scale" + ax.upper())
-            )
-    return result
+        return result
+    command, channels, flags = _CONSTRAINT_TYPES.get(typ)
+    source_name = str(source)
+    constraint_name = command(
+        *(node_names_(target) + [source_name]), mo=maintain_offset, **flags
+    )[0]
+    connect_plugs_(
+        constraint_channel_plugs_(constraint_name, source_name, channels, axes)
+    )
+    return pmc.PyNode(constraint_name)
 
 
 def constraint_ui_node_(constraint=None, target=None):
@@ -292,30 +678,59 @@ def constraint_ui_node_(constraint=None, target=None):
     Return:
             tuple: The created UI node.
     """
+    constraint_ui = None
     if target and constraint:
         if not isinstance(target, list):
             target = [target]
-        constraint_ui = pmc.createNode(
-            "transform", n="{}{}".format(str(constraint), "_UI_GRP")
+        constraint_name = str(constraint)
+        constraint_path = get_dag_path_(constraint_name)
+        # Work on the full path of the UI group. So it is unique even if
+        # other nodes share its short name.
+        constraint_ui_name = create_dag_node_(
+            "transform",
+            "{}{}".format(constraint_name, "_UI_GRP"),
+            constraint_path.fullPathName(),
         )
-        constraint.addChild(constraint_ui)
-        attributes.lock_and_hide_attributes(node=constraint_ui)
-        for x in range(len(target)):
-            long_name = "{}_{}".format(str(target[x]), "W" + str(x))
-            attributes.add_attr(
-                node=constraint_ui,
-                name=long_name,
-                attr_type="float",
+        attributes.lock_and_hide_attributes(node=constraint_ui_name)
+        # The target weight plugs are taken from the target array of the
+        # constraint function set instead of a name lookup per target.
+        constraint_fn = om2.MFnDependencyNode(constraint_path.node())
+        target_plug = find_plug_(constraint_fn, "target")
+        target_weight_attr = constraint_fn.attribute("targetWeight")
+        connections = []
+        for x, target_ in enumerate(target):
+            long_name = "{}_W{}".format(target_, x)
+            # The default value initialize the weight. So no extra set
+            # is needed.
+            cmds.addAttr(
+                constraint_ui_name,
+                longName=long_name,
+                attributeType="float",
                 minValue=0,
                 maxValue=1,
+                defaultValue=1,
                 keyable=True,
             )
-            constraint_ui.attr(long_name).set(1)
-            constraint_ui.attr(long_name).connect(
-                constraint.target[x].targetWeight, force=True
+            connections.append(
+                (
+                    "{}.{}".format(constraint_ui_name, long_name),
+                    target_plug.elementByLogicalIndex(x).child(
+                        target_weight_attr
+                    ),
+                )
+            )
+        # Rewire the weights and remove the now unused user defined weight
+        # attributes of the constraint in one DG modification.
+        ud_attrs = cmds.listAttr(constraint_name, userDefined=True) or []
+        modifier = connect_plugs_(
+            connections, force=True, modifier=om2.MDGModifier()
+        )
+        for ud_attr in ud_attrs:
+            modifier.removeAttribute(
+                constraint_fn.object(), constraint_fn.attribute(ud_attr)
             )
-        for ud_attr in constraint.listAttr(ud=True):
-            pmc.deleteAttr(ud_attr)
+        modifier.doIt()
+        constraint_ui = pmc.PyNode(constraint_ui_name)
     else:
         logger.log(
             level="error",
@@ -331,21 +746,17 @@ def no_pivots_no_rotate_order_(constraint):
     Args:
             constraint(PyNode): The specified constraint.
     """
-    exceptions = []
-    try:
-        constraint.constraintRotatePivot.disconnect()
-    except Exception as e:
-        exceptions.append(e)
-    try:
-        constraint.constraintRotateTranslate.disconnect()
-    except Exception as e:
-        exceptions.append(e)
-    try:
-        constraint.constraintRotateOrder.disconnect()
-    except Exception as e:
-        exceptions.append(e)
-    if exceptions:
-        logger.log(level="warning", message=exceptions, logger=_LOGGER)
+    # Check the attributes on the function set instead of trying to
+    # disconnect each plug by name. Not every constraint type has all
+    # pivot plugs.
+    constraint_fn = om2.MFnDependencyNode(get_dag_path_(constraint).node())
+    modifier = om2.MDGModifier()
+    for attribute in _CONSTRAINT_PIVOT_PLUGS:
+        if constraint_fn.hasAttribute(attribute):
+            disconnect_input_plug_(
+                find_plug_(constraint_fn, attribute), modifier=modifier
+            )
+    modifier.doIt()
 
 
 def no_constraint_cycle(constraint=None, source=None, target=None):
@@ -359,13 +770,21 @@ def no_constraint_cycle(constraint=None, source=None, target=None):
     Return:
             tuple: The constraint UI node.
     """
-    if not isinstance(source[0], list):
+    if not isinstance(source, list):
         source = [source]
-    parent = source[0].getParent()
+    parent = cmds.listRelatives(str(source[0]), parent=True, fullPath=True)
     if parent:
-        constraint.constraintParentInverseMatrix.disconnect()
-        parent.worldInverseMatrix.connect(
-            constraint.constraintParentInverseMatrix
+        parent_inverse_plug = "{}.constraintParentInverseMatrix".format(
+            constraint
+        )
+        connect_plugs_(
+            [
+                (
+                    "{}.worldInverseMatrix[0]".format(parent[0]),
+                    parent_inverse_plug,
+                )
+            ],
+            force=True,
         )
     return constraint_ui_node_(constraint=constraint, target=target)
 
@@ -375,7 +794,7 @@ def create_constraint(
     source=None,
     target=None,
     maintain_offset=True,
-    axes=["X", "Y", "Z"],
+    axes=("X", "Y", "Z"),
     no_cycle=False,
     no_pivots=False,
     no_parent_influ=False,
@@ -418,7 +837,9 @@ def create_constraint(
     if no_pivots:
         no_pivots_no_rotate_order_(constraint=constraint_)
     if no_parent_influ:
-        constraint_.constraintParentInverseMatrix.disconnect()
+        disconnect_input_plug_(
+            "{}.constraintParentInverseMatrix".format(constraint_)
+        )
     return result
 
 
@@ -426,14 +847,14 @@ def aim_constraint_(
     source=None,
     target=None,
     maintain_offset=True,
-    axes=["X", "Y", "Z"],
-    aim_axes=[1, 0, 0],
-    up_axes=[0, 1, 0],
+    axes=("X", "Y", "Z"),
+    aim_axes=(1, 0, 0),
+    up_axes=(0, 1, 0),
     world_up_type="object",
     kill_up_vec_obj=None,
     parent_up_vec_obj=None,
     world_up_object=None,
-    world_up_vector=[0, 1, 0],
+    world_up_vector=(0, 1, 0),
 ):
     """
     Create a aimConstraint.
@@ -459,71 +880,47 @@ def aim_constraint_(
     Return:
             list: The aim constraint, the upVector locator node.
     """
-    skip_axes = ["x", "y", "z"]
     temp = []
-    if world_up_type == "object":
-        if not world_up_object:
-            world_up_object = pmc.spaceLocator(n=str(source) + "_upVec_0_LOC")
-            world_up_object_buffer = pmc.group(
-                world_up_object, n=str(world_up_object) + "_buffer_GRP"
-            )
-            temp.append(world_up_object_buffer)
-            pmc.delete(
-                pmc.parentConstraint(source, world_up_object_buffer, mo=False)
-            )
-            world_up_object.translate.set(v * 5 for v in up_axes)
-        con = pmc.aimConstraint(
-            target,
-            source,
-            mo=maintain_offset,
-            aim=aim_axes,
-            skip=skip_axes,
-            u=up_axes,
-            worldUpType=world_up_type,
-            worldUpObject=world_up_object,
+    source_name = str(source)
+    flags = {
+        "mo": maintain_offset,
+        "aim": aim_axes,
+        "skip": _SKIP_AXES,
+        "u": up_axes,
+        "worldUpType": world_up_type,
+    }
+    if world_up_type == "object" and not world_up_object:
+        world_up_object = pmc.spaceLocator(n="{}_upVec_0_LOC".format(source))
+        world_up_object_buffer = pmc.group(
+            world_up_object, n="{}_buffer_GRP".format(world_up_object)
         )
-    elif world_up_type == "objectrotation":
-        con = pmc.aimConstraint(
-            target,
-            source,
-            mo=maintain_offset,
-            aim=aim_axes,
-            skip=skip_axes,
-            u=up_axes,
-            worldUpType=world_up_type,
-            worldUpObject=world_up_object,
+        temp.append(world_up_object_buffer)
+        snap_transform(world_up_object_buffer, source)
+        cmds.setAttr(
+            "{}.translate".format(world_up_object),
+            up_axes[0] * 5.0,
+            up_axes[1] * 5.0,
+            up_axes[2] * 5.0,
         )
+    if world_up_type in _AIM_WORLD_UP_OBJECT_TYPES and world_up_object:
+        flags["worldUpObject"] = str(world_up_object)
     elif world_up_type == "vector":
-        con = pmc.aimConstraint(
-            target,
-            source,
-            mo=maintain_offset,
-            aim=aim_axes,
-            skip=skip_axes,
-            u=up_axes,
-            worldUpType=world_up_type,
-            worldUpVector=world_up_vector,
-        )
-    else:
-        con = pmc.aimConstraint(
-            target,
-            source,
-            mo=maintain_offset,
-            aim=aim_axes,
-            skip=skip_axes,
-            u=up_axes,
-            worldUpType=world_up_type,
-        )
-    for ax in axes:
-        con.attr("constraintRotate" + ax.upper()).connect(
-            source.attr("rotate" + ax.upper())
+        flags["worldUpVector"] = world_up_vector
+    con = cmds.aimConstraint(
+        *(node_names_(target) + [source_name]), **flags
+    )[0]
+    connect_plugs_(
+        constraint_channel_plugs_(
+            con, source_name, (_CONSTRAINT_ROTATE,), axes
         )
+    )
+    con = pmc.PyNode(con)
     temp.append(world_up_object)
     if kill_up_vec_obj:
         pmc.delete(temp)
         return [con]
     if parent_up_vec_obj:
-        pmc.parent(temp[0], parent_up_vec_obj)
+        parent_node_(temp[0], parent_up_vec_obj)
     return [con, temp[:]]
 
 
@@ -531,14 +928,14 @@ def create_aim_constraint(
     source=None,
     target=None,
     maintain_offset=True,
-    axes=["X", "Y", "Z"],
-    aim_axes=[1, 0, 0],
-    up_axes=[0, 1, 0],
+    axes=("X", "Y", "Z"),
+    aim_axes=(1, 0, 0),
+    up_axes=(0, 1, 0),
     world_up_type="object",
     kill_up_vec_obj=None,
     parent_up_vec_obj=None,
     world_up_object=None,
-    world_up_vector=[0, 1, 0],
+    world_up_vector=(0, 1, 0),
     no_cycle=False,
     no_pivots=False,
     no_parent_influ=False,
@@ -597,7 +994,9 @@ def create_aim_constraint(
     if no_pivots:
         no_pivots_no_rotate_order_(constraint=result[0])
     if no_parent_influ:
-        result[0].constraintParentInverseMatrix.disconnect()
+        disconnect_input_plug_(
+            "{}.constraintParentInverseMatrix".format(result[0])
+        )
     return result
 
 
@@ -622,17 +1021,31 @@ def decompose_matrix_constraint(
     Return:
             tuple: Created decompose matrix node.
     """
-    decomp = pmc.createNode("decomposeMatrix", n=str(source) + "_0_DEMAND")
+    source_name = str(source)
     if not target_plug:
         target_plug = "worldMatrix[0]"
-    target.attr(target_plug).connect(decomp.inputMatrix)
-    if translation:
-        decomp.outputTranslate.connect(source.translate, force=True)
-    if rotation:
-        decomp.outputRotate.connect(source.rotate, force=True)
-    if scale:
-        decomp.outputScale.connect(source.scale, force=True)
-    return decomp
+    # The node and its connections are made with maya.cmds like the other
+    # constraint helpers. So the setup is undoable and the node gets a
+    # unique name.
+    decomp_name = cmds.createNode(
+        "decomposeMatrix", n="{}_0_DEMAND".format(source_name), skipSelect=True
+    )
+    cmds.connectAttr(
+        "{}.{}".format(str(target), target_plug),
+        "{}.inputMatrix".format(decomp_name),
+    )
+    for enabled, channels in zip(
+        (translation, rotation, scale), _MATRIX_CONSTRAINT_CHANNELS
+    ):
+        if not enabled:
+            continue
+        for output_attr, channel_attr in channels:
+            cmds.connectAttr(
+                "{}.{}".format(decomp_name, output_attr),
+                "{}.{}".format(source_name, channel_attr),
+                force=True,
+            )
+    return pmc.PyNode(decomp_name)
 
 
 def calculate_matrix_offset_(target, source, target_plug=None):
@@ -641,64 +1054,17 @@ def calculate_matrix_offset_(target, source, target_plug=None):
     Args:
             target(dagnode): The target node.
             source(dagnode): The source node.
+            target_plug(str): The targets matrix plug name. If none
+            the world matrix of the target is taken.
     Return:
-            The offset matrix values from target to source.
+            om2.MMatrix: The offset matrix from target to source.
     """
-
     if not target_plug:
-        tm = dt.Matrix(target.getMatrix(ws=True)).inverse()
+        tm = om2.MMatrix(cmds.xform(str(target), q=True, ws=True, m=True))
     else:
-        tm = dt.Matrix(target.attr(target_plug).get()).inverse()
-    sm = dt.Matrix(source.getMatrix(ws=True))
-    return sm.__mul__(tm)
-
-
-def matrix_constraint_ui_grp_(source):
-    """
-    Creates the the UI node for the matrix constraint
-    and parent it under a specified node.
-    Args:
-            source(dagnode): The source node.
-            parent(dagnode): The parent for the UI GRP.
-    Return:
-            tuple: The UI_GRP node.
-    """
-    ui_grp = pmc.createNode(
-        "transform", n=str(source) + "_matrixConstraint_UI_GRP"
-    )
-    attributes.add_attr(node=ui_grp, name="offset_matrix", attrType="matrix")
-    attributes.lock_and_hide_attributes(node=ui_grp)
-    source.addChild(ui_grp)
-    return ui_grp
-
-
-def mult_matrix_setup_(source, target, maintainOffset=None, target_plug=None):
-    """
-    Creates the multMatrix setup for further use.
-    Args:
-            source(dagnode): The source node.
-            target(dagnode): The target node.
-            maintainOffste(bool): Enable/Disable the maintainOffset option.
-            target_plug(str): The targets plug name.
-    Return:
-            tuple: The created multMatrix node.
-    """
-    parent = source.getParent()
-    mul_ma_nd = pmc.createNode("multMatrix", n=str(source) + "_0_MUMAND")
-    if not target_plug:
-        target_plug = "worldMatrix[0]"
-    target.attr(target_plug).connect(mul_ma_nd.matrixIn[1])
-    if parent:
-        parent.worldInverseMatrix[0].connect(mul_ma_nd.matrixIn[2])
-    else:
-        source.parentInverseMatrix[0].connect(mul_ma_nd.matrixIn[2])
-    if maintainOffset:
-        ui_grp = matrix_constraint_ui_grp_(source=source)
-        ui_grp.offset_matrix.set(
-            calculate_matrix_offset_(target, source, target_plug)
-        )
-        ui_grp.offset_matrix.connect(mul_ma_nd.matrixIn[0])
-    return mul_ma_nd
+        tm = om2.MMatrix(cmds.getAttr("{}.{}".format(target, target_plug)))
+    sm = om2.MMatrix(cmds.xform(str(source), q=True, ws=True, m=True))
+    return sm * tm.inverse()
 
 
 def create_matrix_constraint(
@@ -709,6 +1075,7 @@ def create_matrix_constraint(
     scale=True,
     maintain_offset=None,
     target_plug=None,
+    modifier=None,
 ):
     """
     Creates the matrix constraint.
@@ -720,37 +1087,125 @@ def create_matrix_constraint(
             scale(bool): Connect/Disconnect the scale channel.
             maintainOffste(bool): Enable/Disable the maintain_offset option.
             target_plug(str): The targets plug name.
+            modifier(om2.MDGModifier): Modifier to collect the
+            connections. If passed the caller has to execute it.
 
     Returns:
         pmc.PyNode(): The mul matrix node of the constraint setup.
     """
-    axis = ["X", "Y", "Z"]
-    decomp_mat_nd = pmc.createNode(
-        "decomposeMatrix", n=str(source) + "_0_DEMAND"
+    source_name = str(source)
+    if not target_plug:
+        target_plug = "worldMatrix[0]"
+    # Resolve the source and its parent once in the api. The plugs are
+    # taken from the function sets instead of plug name lookups.
+    source_path = get_dag_path_(source_name)
+    source_fn = om2.MFnDagNode(source_path)
+    if source_path.length() > 1:
+        parent_path = om2.MDagPath(source_path)
+        parent_path.pop()
+        parent_plug = find_plug_(
+            om2.MFnDagNode(parent_path), "worldInverseMatrix", 0
+        )
+    else:
+        parent_plug = find_plug_(source_fn, "parentInverseMatrix", 0)
+    # The multMatrix and the decomposeMatrix are created with maya.cmds. So
+    # they are undoable like the UI group and get unique names. Only the
+    # connections of the setup are collected in one modifier and made in a
+    # single DG modification.
+    execute = modifier is None
+    if execute:
+        modifier = om2.MDGModifier()
+    decomp_mat_name = cmds.createNode(
+        "decomposeMatrix", n=source_name + "_0_DEMAND", skipSelect=True
     )
-    mul_ma_nd = mult_matrix_setup_(
-        source=source,
-        target=target,
-        maintainOffset=maintain_offset,
-        target_plug=target_plug,
+    mul_ma_name = cmds.createNode(
+        "multMatrix", n=source_name + "_0_MUMAND", skipSelect=True
     )
-    mul_ma_nd.matrixSum.connect(decomp_mat_nd.inputMatrix)
-    if translation:
-        for axe in axis:
-            decomp_mat_nd.attr("outputTranslate" + axe).connect(
-                source.attr("translate" + axe)
-            )
-    if rotation:
-        for axe in axis:
-            decomp_mat_nd.attr("outputRotate" + axe).connect(
-                source.attr("rotate" + axe)
+    connections = [
+        (
+            get_plug_("{}.{}".format(str(target), target_plug)),
+            get_plug_("{}.matrixIn[1]".format(mul_ma_name)),
+        ),
+        (parent_plug, get_plug_("{}.matrixIn[2]".format(mul_ma_name))),
+        (
+            get_plug_("{}.matrixSum".format(mul_ma_name)),
+            get_plug_("{}.inputMatrix".format(decomp_mat_name)),
+        ),
+    ]
+    if maintain_offset:
+        # The UI node holds the offset matrix of the constraint. It is
+        # built with maya.cmds on its full path under the source.
+        ui_grp = create_dag_node_(
+            "transform",
+            "{}_matrixConstraint_UI_GRP".format(source_name),
+            source_path.fullPathName(),
+        )
+        cmds.addAttr(
+            ui_grp,
+            longName="offset_matrix",
+            attributeType="matrix",
+            keyable=True,
+            disconnectBehaviour=2,
+        )
+        attributes.lock_and_hide_attributes(node=ui_grp)
+        cmds.setAttr(
+            "{}.offset_matrix".format(ui_grp),
+            list(calculate_matrix_offset_(target, source, target_plug)),
+            type="matrix",
+        )
+        connections.append(
+            (
+                get_plug_("{}.offset_matrix".format(ui_grp)),
+                get_plug_("{}.matrixIn[0]".format(mul_ma_name)),
             )
-    if scale:
-        for axe in axis:
-            decomp_mat_nd.attr("outputScale" + axe).connect(
-                source.attr("scale" + axe)
+        )
+    # Translate and rotate are connected as compound plugs. The scale is
+    # connected per axis.
+    for enabled, channels in zip(
+        (translation, rotation, scale), _MATRIX_CONSTRAINT_CHANNELS
+    ):
+        if not enabled:
+            continue
+        connections.extend(
+            (
+                get_plug_("{}.{}".format(decomp_mat_name, output_attr)),
+                find_plug_(source_fn, channel_attr),
             )
-    return mul_ma_nd
+            for output_attr, channel_attr in channels
+        )
+    for source_plug, destination_plug in connections:
+        modifier.connect(source_plug, destination_plug)
+    if execute:
+        modifier.doIt()
+    return pmc.PyNode(mul_ma_name)
+
+
+def create_matrix_constraints(data_list):
+    """
+    Create matrix constraints by a list of data dictionaries. The
+    connections of all constraints are made in one DG modification. So
+    the offsets are calculated from the pose before any of the constraints
+    is connected.
+    Args:
+            data_list(list): A List filled with dictionaries. The keys are
+            the arguments of create_matrix_constraint.
+
+    Example:
+            >>> create_matrix_constraints([{'source': pmc.PyNode('A'),
+            >>> 'target': pmc.PyNode('B'), 'maintain_offset': True},
+            >>> {'source': pmc.PyNode('C'), 'target': pmc.PyNode('B'),
+            >>> 'scale': False}])
+
+    Return:
+            list: The mul matrix nodes of the constraint setups.
+    """
+    modifier = om2.MDGModifier()
+    mul_ma_nds = [
+        create_matrix_constraint(modifier=modifier, **data)
+        for data in data_list
+    ]
+    modifier.doIt()
+    return mul_ma_nds
 
 
 def ancestors(node):
@@ -763,11 +1218,13 @@ def ancestors(node):
             list: The ancestors tranforms.
     """
     result = []
-    parent = node.getParent()
-    while parent is not None:
-        result.append(parent)
-        parent = parent.getParent()
-    return result
+    dag_path = get_dag_path_(node)
+    # Walk up the dag path in the api and only wrap the found
+    # parents into PyNodes.
+    while dag_path.length() > 1:
+        dag_path.pop()
+        result.append(dag_path.fullPathName())
+    return [pmc.PyNode(parent) for parent in result]
 
 
 def descendants(root_node, reverse=None, typ="transform"):
@@ -781,14 +1238,17 @@ def descendants(root_node, reverse=None, typ="transform"):
     Return:
             list: The descendant nodes.
     """
-    result = []
-    descendants = root_node.getChildren(ad=True, type=typ)
+    # listRelatives returns the descendants bottom up with full path
+    # names. So the nodes are only wrapped into PyNodes at the end.
+    descendants = (
+        cmds.listRelatives(str(root_node), ad=True, type=typ, fullPath=True)
+        or []
+    )
     if not reverse:
-        for descendant in descendants:
-            result.insert(0, descendant)
-        result.insert(0, root_node)
+        result = [root_node]
+        result.extend(pmc.PyNode(dsc) for dsc in reversed(descendants))
     else:
-        result = descendants
+        result = [pmc.PyNode(dsc) for dsc in descendants]
         result.append(root_node)
     return result
 
@@ -805,13 +1265,117 @@ def get_descendants_from_parent(node, reverse=None, typ="transform"):
     Return:
             list: The descendant nodes.
     """
-    if node.getParent():
-        return descendants(node.getParent(), reverse=reverse, typ=typ)
+    parent = cmds.listRelatives(str(node), parent=True, fullPath=True)
+    if parent:
+        return descendants(pmc.PyNode(parent[0]), reverse=reverse, typ=typ)
     else:
         raise IndexError("{} has no parent node".format(str(node)))
 
 
-def custom_orient_joint(source, target, aim_axes=[1, 0, 0], up_axes=[0, 1, 0]):
+def matrix_from_axes_(x_axis, y_axis, z_axis):
+    """
+    Build a rotation matrix from three axes vectors.
+    Args:
+            x_axis(om2.MVector): The first row of the matrix.
+            y_axis(om2.MVector): The second row of the matrix.
+            z_axis(om2.MVector): The third row of the matrix.
+    Return:
+            om2.MMatrix: The rotation matrix.
+    """
+    return om2.MMatrix(
+        (
+            (x_axis.x, x_axis.y, x_axis.z, 0.0),
+            (y_axis.x, y_axis.y, y_axis.z, 0.0),
+            (z_axis.x, z_axis.y, z_axis.z, 0.0),
+            (0.0, 0.0, 0.0, 1.0),
+        )
+    )
+
+
+def local_axes_matrix_(aim_axes, up_axes):
+    """
+    Get the inverse of the local aim frame for the aim and up axes. The
+    result is cached, because all joints of a hierarchy share the same
+    axes.
+    Args:
+            aim_axes(list): The aim axes. [1, 1, 1] = [x, y, z]
+            up_axes(list): The up axes. [1, 1, 1] = [x, y, z]
+    Return:
+            om2.MMatrix: The inverse local aim frame.
+    """
+    key = (tuple(aim_axes), tuple(up_axes))
+    if key not in _LOCAL_AXES_MATRICES:
+        local_aim = om2.MVector(aim_axes).normal()
+        local_side = (local_aim ^ om2.MVector(up_axes)).normal()
+        local_up = local_side ^ local_aim
+        _LOCAL_AXES_MATRICES[key] = matrix_from_axes_(
+            local_aim, local_up, local_side
+        ).transpose()
+    return om2.MMatrix(_LOCAL_AXES_MATRICES.get(key))
+
+
+def aim_matrix_(aim_vector, up_vector, aim_axes=(1, 0, 0), up_axes=(0, 1, 0)):
+    """
+    Calculate the world rotation matrix which points the aim axes along the
+    aim vector and the up axes towards the up vector. It is the same
+    solution as the aimConstraint with a up vector.
+    Args:
+            aim_vector(om2.MVector): The world aim direction.
+            up_vector(om2.MVector): The world up direction.
+            aim_axes(list): The aim axes. [1, 1, 1] = [x, y, z]
+            up_axes(list): The up axes. [1, 1, 1] = [x, y, z]
+    Return:
+            om2.MMatrix: The world rotation matrix.
+    """
+    world_aim = aim_vector.normal()
+    world_side = (world_aim ^ up_vector).normal()
+    world_up = world_side ^ world_aim
+    world_matrix = matrix_from_axes_(world_aim, world_up, world_side)
+    return local_axes_matrix_(aim_axes, up_axes) * world_matrix
+
+
+def set_joint_orient_(joint, rotation_matrix):
+    """
+    Set the jointOrient of a joint to a world rotation and reset the
+    rotate channels.
+    Args:
+            joint(str): The joint name.
+            rotation_matrix(om2.MMatrix): The world rotation.
+    """
+    # The parent inverse matrix is read from the dag path of the joint.
+    # The values are written with setAttr. So they are on the undo queue
+    # like the translation moves of the hierarchy orient.
+    orient = om2.MTransformationMatrix(
+        rotation_matrix * get_dag_path_(joint).exclusiveMatrixInverse()
+    ).rotation()
+    cmds.setAttr(joint + ".rotate", 0, 0, 0)
+    cmds.setAttr(
+        joint + ".jointOrient",
+        *[math.degrees(value) for value in (orient.x, orient.y, orient.z)]
+    )
+
+
+def rotation_to_joint_orient_(joint):
+    """
+    Move the rotate values of a joint into its jointOrient and reset the
+    rotate channels.
+    Args:
+            joint(str): The joint name.
+    """
+    # The rotation is read on the function set of the joint. The
+    # orientation takes the plain rotate values in xyz order. Both values
+    # are written with setAttr. So they are on the undo queue.
+    rotation = oma2.MFnIkJoint(get_dag_path_(joint)).rotation(
+        om2.MSpace.kTransform
+    )
+    angles = (rotation.x, rotation.y, rotation.z)
+    cmds.setAttr(
+        joint + ".jointOrient", *[math.degrees(value) for value in angles]
+    )
+    cmds.setAttr(joint + ".rotate", 0, 0, 0)
+
+
+def custom_orient_joint(source, target, aim_axes=(1, 0, 0), up_axes=(0, 1, 0)):
     """
     Orient a joint based on aimConstraint technic.
     By default it orients the x axes
@@ -825,25 +1389,23 @@ def custom_orient_joint(source, target, aim_axes=[1, 0, 0], up_axes=[0, 1, 0]):
             tuple: The orientated joint.
     """
     if source.nodeType() == "joint":
-        up_object = space_locator_on_position(source, buffer_grp=True)
-        up_object[1].translate.set(v * 5 for v in up_axes)
-        source.rotate.set(0, 0, 0)
-        source.jointOrient.set(0, 0, 0)
-        pmc.delete(
-            create_aim_constraint(
-                source=source,
-                target=target,
-                maintain_offset=False,
-                aim_axes=aim_axes,
-                up_axes=up_axes,
-                world_up_type="object",
-                world_up_object=up_object[1],
-                kill_up_vec_obj=False,
-            )[0]
+        # Solve the aimConstraint directly instead of creating a up
+        # vector locator and a aimConstraint for each joint.
+        source_name = str(source)
+        source_matrix = om2.MMatrix(
+            cmds.xform(source_name, q=True, ws=True, m=True)
+        )
+        source_position = om2.MVector(
+            cmds.xform(source_name, q=True, ws=True, rp=True)
+        )
+        target_position = om2.MVector(
+            cmds.xform(str(target), q=True, ws=True, rp=True)
         )
-        pmc.delete(up_object)
-        source.jointOrient.set(source.rotate.get())
-        source.rotate.set(0, 0, 0)
+        up_vector = om2.MVector(up_axes) * source_matrix
+        rotation_matrix = aim_matrix_(
+            target_position - source_position, up_vector, aim_axes, up_axes
+        )
+        set_joint_orient_(source_name, rotation_matrix)
         return source
     else:
         logger.log(
@@ -854,7 +1416,7 @@ def custom_orient_joint(source, target, aim_axes=[1, 0, 0], up_axes=[0, 1, 0]):
 
 
 def custom_orient_joint_hierarchy(
-    root_jnt=None, aim_axes=[1, 0, 0], up_axes=[0, 1, 0]
+    root_jnt=None, aim_axes=(1, 0, 0), up_axes=(0, 1, 0)
 ):
     """
     Orient a joint hierarchy based on a aimConstraint technic.
@@ -867,27 +1429,57 @@ def custom_orient_joint_hierarchy(
     Return:
             list: The hierarchy.
     """
-    hierarchy = descendants(root_node=root_jnt, reverse=True, typ="joint")
-    if len(hierarchy) > 1:
-        temp = hierarchy[:]
-        for jnt in hierarchy:
-            pmc.parent(jnt, w=True)
-        for jnt_ in hierarchy:
-            if len(temp) > 1:
-                custom_orient_joint(
-                    temp[1], temp[0], aim_axes=aim_axes, up_axes=up_axes
+    with suspend_refresh(), dg_evaluation():
+        hierarchy = descendants(root_node=root_jnt, reverse=True, typ="joint")
+        if len(hierarchy) > 1:
+            # Cache the world matrices and positions of the chain. So the
+            # joints can be oriented top down in place without unparenting
+            # them.
+            names = [jnt.longName() for jnt in hierarchy]
+            matrices = [
+                om2.MMatrix(cmds.xform(name, q=True, ws=True, m=True))
+                for name in names
+            ]
+            positions = [
+                om2.MVector(cmds.xform(name, q=True, ws=True, rp=True))
+                for name in names
+            ]
+            translations = [
+                list(
+                    om2.MTransformationMatrix(matrix).translation(
+                        om2.MSpace.kWorld
+                    )
                 )
-                temp[1].addChild(temp[0])
-                temp.remove(temp[0])
-        hierarchy[0].rotate.set(0, 0, 0)
-        hierarchy[0].jointOrient.set(0, 0, 0)
-        return hierarchy
-    else:
-        logger.log(
-            level="error",
-            message="It must be a hierarchy for a proper orient",
-            logger=_LOGGER,
-        )
+                for matrix in matrices
+            ]
+            # Solve the whole chain in one pure math pass before touching the
+            # scene. So the loop below does only the writes.
+            local_up_vector = om2.MVector(up_axes)
+            rotation_matrices = [None] + [
+                aim_matrix_(
+                    positions[index - 1] - positions[index],
+                    local_up_vector * matrices[index],
+                    aim_axes,
+                    up_axes,
+                )
+                for index in range(1, len(names))
+            ]
+            for index in range(len(names) - 1, 0, -1):
+                name = names[index]
+                # Move the joint back to its position after the parent
+                # orientation has changed.
+                cmds.xform(name, ws=True, t=translations[index])
+                set_joint_orient_(name, rotation_matrices[index])
+            cmds.xform(names[0], ws=True, t=translations[0])
+            cmds.setAttr(names[0] + ".rotate", 0, 0, 0)
+            cmds.setAttr(names[0] + ".jointOrient", 0, 0, 0)
+            return hierarchy
+        else:
+            logger.log(
+                level="error",
+                message="It must be a hierarchy for a proper orient",
+                logger=_LOGGER,
+            )
 
 
 def default_orient_joint(node, aim_axes="xyz", up_axes="yup"):
@@ -902,9 +1494,15 @@ def default_orient_joint(node, aim_axes="xyz", up_axes="yup"):
             up_axes(str): Valid is xup, xdown, yup, ydown,
             zup, zdown, none.
     """
-    if node.nodeType() == "joint":
+    node_name = get_dag_path_(node).fullPathName()
+    if cmds.nodeType(node_name) == "joint":
         try:
-            node.orientJoint(val=aim_axes, secondaryAxisOrient=up_axes)
+            cmds.joint(
+                node_name,
+                edit=True,
+                orientJoint=aim_axes,
+                secondaryAxisOrient=up_axes,
+            )
         except:
             logger.log(
                 level="error",
@@ -932,10 +1530,78 @@ def default_orient_joint_hierarchy(root_node, aim_axes="xyz", up_axes="yup"):
     Return:
             list: The hierarchy.
     """
-    hierarchy = descendants(root_node=root_node, reverse=True, typ="joint")
-    for jnt in hierarchy[1:]:
-        default_orient_joint(node=jnt, aim_axes=aim_axes, up_axes=up_axes)
-    hierarchy[0].jointOrient.set(0, 0, 0)
+    with suspend_refresh(), dg_evaluation():
+        hierarchy = descendants(root_node=root_node, reverse=True, typ="joint")
+        for jnt in hierarchy[1:]:
+            default_orient_joint(node=jnt, aim_axes=aim_axes, up_axes=up_axes)
+        cmds.setAttr(hierarchy[0].longName() + ".jointOrient", 0, 0, 0)
+        return hierarchy
+
+
+def check_joint_typ_(typ):
+    """
+    Check if a joint typ has a preset. If not it throws a warning.
+    Args:
+            typ(str): Typ of the joint. Valid is: [BND, DRV, FK, IK]
+    Return:
+            bool: True if the typ has a preset.
+    """
+    if typ in _JOINT_PRESETS:
+        return True
+    logger.log(
+        level="warning",
+        message='Joint typ "{}" has no preset. Valid are {}'.format(
+            typ, sorted(_JOINT_PRESETS)
+        ),
+        logger=_LOGGER,
+    )
+    return False
+
+
+def joint_preset_values_(jnt, typ):
+    """
+    Set the radius and override color preset of a joint typ. Types
+    without preset are skipped. The values are set with setAttr. So they
+    are restored on redo like the joint itself.
+    Args:
+            jnt(str): The full path of the joint.
+            typ(str): Typ of the joint. Valid is: [BND, DRV, FK, IK]
+    """
+    preset = _JOINT_PRESETS.get(typ)
+    if preset:
+        radius, override_color = preset
+        cmds.setAttr(jnt + ".overrideEnabled", True)
+        cmds.setAttr(jnt + ".radius", radius)
+        cmds.setAttr(jnt + ".overrideColor", override_color)
+
+
+def create_joint_chain_(names, typs, inverse_scale=True):
+    """
+    Create a joint chain with maya.cmds. So the whole chain can be
+    undone.
+    Args:
+            names(list): The joint names from the root down.
+            typs(list): The joint typ of each joint.
+            inverse_scale(bool): Connect the scale of each parent joint
+            with the inverseScale of its child.
+    Return:
+            list(str): The full paths of the joints.
+    """
+    joints = []
+    for name, typ in zip(names, typs):
+        # Joints created under a parent have no inverseScale connection.
+        # So it is connected like a parent command would do.
+        if joints:
+            jnt_name = create_dag_node_("joint", name, joints[-1])
+            if inverse_scale:
+                cmds.connectAttr(
+                    joints[-1] + ".scale", jnt_name + ".inverseScale"
+                )
+        else:
+            jnt_name = create_dag_node_("joint", name)
+        joint_preset_values_(jnt_name, typ)
+        joints.append(jnt_name)
+    return joints
 
 
 def create_joint(
@@ -961,26 +1627,22 @@ def create_joint(
             tuple: The created joint node.
     """
     name = strings.string_checkup(name, _LOGGER)
-    data = [
-        {"typ": "BND", "radius": 1, "overrideColor": 17},
-        {"typ": "DRV", "radius": 2.5, "overrideColor": 18},
-        {"typ": "FK", "radius": 1.5, "overrideColor": 4},
-        {"typ": "IK", "radius": 2, "overrideColor": 6},
-    ]
-    jnt = pmc.createNode("joint", n=name)
-    for util in data:
-        if util["typ"] == typ:
-            jnt.overrideEnabled.set(1)
-            jnt.radius.set(util["radius"])
-            jnt.overrideColor.set(util["overrideColor"])
+    # The returned joint is the only PyNode. All edits are done with
+    # maya.cmds on its full path, which is unique even if the short name
+    # is not.
+    jnt_name = create_dag_node_("joint", name)
+    if check_joint_typ_(typ):
+        joint_preset_values_(jnt_name, typ)
     if node:
-        jnt.setMatrix(node.getMatrix(worldSpace=True), worldSpace=True)
+        # Copy the world matrix as flat list. No pymel matrix is built.
+        cmds.xform(
+            jnt_name, ws=True, m=cmds.xform(str(node), q=True, ws=True, m=True)
+        )
     if orient_match_rotation:
-        jnt.jointOrient.set(jnt.rotate.get())
-        jnt.rotate.set(0, 0, 0)
+        rotation_to_joint_orient_(jnt_name)
     if match_matrix:
-        jnt.setMatrix(match_matrix, worldSpace=True)
-    return jnt
+        cmds.xform(jnt_name, ws=True, m=list(om2.MMatrix(match_matrix)))
+    return pmc.PyNode(jnt_name)
 
 
 def convert_to_skeleton(
@@ -1008,29 +1670,44 @@ def convert_to_skeleton(
     Return:
             list: The new created joint hierarchy.
     """
-    result = []
-    hierarchy = descendants(root_node=root_node)
-    if hierarchy:
-        for tra in range(len(hierarchy)):
-            name = "{}_{}_{}".format(prefix, str(tra), suffix)
-            name = strings.string_checkup(name, _LOGGER)
-            jnt = create_joint(name=name, node=hierarchy[tra], typ=typ)
-            result.append(jnt)
-    temp = result[:]
-    for node in hierarchy:
-        if len(temp) > 1:
-            temp[-2].addChild(temp[-1])
-            temp.remove(temp[-1])
-    if buffer_grp:
-        buffer_grp = create_buffer_grp(node=result[0])
-        result.insert(0, buffer_grp)
-    if inverse_scale:
-        for node in result:
-            try:
-                node.inverseScale.disconnect()
-            except:
-                continue
-    return result
+    if not root_node:
+        logger.log(
+            level="error",
+            message="A root node is needed to convert a skeleton",
+            logger=_LOGGER,
+        )
+        return []
+    # Warn once for the whole chain instead of once per joint.
+    check_joint_typ_(typ)
+    with undo_chunk("convert_to_skeleton"):
+        hierarchy = descendants(root_node=root_node)
+        # Create the chain with undoable commands. So the chunk covers the
+        # whole skeleton. The inverseScale is only connected if it should
+        # be kept.
+        joints = create_joint_chain_(
+            [
+                strings.string_checkup(
+                    "{}_{}_{}".format(prefix, index, suffix), _LOGGER
+                )
+                for index in range(len(hierarchy))
+            ],
+            [typ] * len(hierarchy),
+            inverse_scale=not inverse_scale,
+        )
+        # Match the joints top down. So each parent is in place before its
+        # child is matched in world space.
+        result = []
+        for jnt_name, node in zip(joints, hierarchy):
+            cmds.xform(
+                jnt_name,
+                ws=True,
+                m=cmds.xform(str(node), q=True, ws=True, m=True),
+            )
+            rotation_to_joint_orient_(jnt_name)
+            result.append(pmc.PyNode(jnt_name))
+        if buffer_grp:
+            result = [create_buffer_grp(node=result[0])] + result
+        return result
 
 
 def create_motion_path(
@@ -1043,7 +1720,7 @@ def create_motion_path(
     aim_axes="x",
     up_axes="y",
     follow=True,
-    world_up_vector=[0, 0, 1],
+    world_up_vector=(0, 0, 1),
 ):
     """
     Create a motionPath node. By default the world_up_type is objectUp. The
@@ -1064,63 +1741,66 @@ def create_motion_path(
     Return:
             tuple: The created motion path node.
     """
-    axes = ["X", "Y", "Z"]
-    name = strings.string_checkup(name, _LOGGER)
-    mpnd = pmc.createNode("motionPath", n=name)
-    mpnd.fractionMode.set(1)
-    mpnd.uValue.set(position)
-    curve_shape.worldSpace[0].connect(mpnd.geometryPath)
-    if target:
-        for axe in axes:
-            mpnd.attr("rotate" + axe).connect(
-                target.attr("rotate" + axe), force=True
+    with undo_chunk("create_motion_path"):
+        name = strings.string_checkup(name, _LOGGER)
+        # Build the node with maya.cmds on its name. Only the returned node is
+        # wrapped into a PyNode.
+        mpnd_name = cmds.createNode("motionPath", n=name)
+        cmds.setAttr(mpnd_name + ".fractionMode", 1)
+        cmds.setAttr(mpnd_name + ".uValue", position)
+        # The connections are made with connectAttr. So they are part of
+        # the undo chunk.
+        cmds.connectAttr(
+            "{}.worldSpace[0]".format(curve_shape),
+            "{}.geometryPath".format(mpnd_name),
+            force=True,
+        )
+        if target:
+            # Connect the compound plugs instead of each axis.
+            target_name = str(target)
+            cmds.connectAttr(
+                "{}.rotate".format(mpnd_name),
+                "{}.rotate".format(target_name),
+                force=True,
             )
-            mpnd.attr(axe.lower() + "Coordinate").connect(
-                target.attr("translate" + axe), force=True
+            cmds.connectAttr(
+                "{}.allCoordinates".format(mpnd_name),
+                "{}.translate".format(target_name),
+                force=True,
             )
-    if follow:
-        if aim_axes == "x":
-            value = 0
-        elif aim_axes == "y":
-            value = 1
-        elif aim_axes == "z":
-            value = 2
-        if up_axes == "x":
-            value_ = 0
-        elif up_axes == "y":
-            value_ = 1
-        elif up_axes == "z":
-            value_ = 2
-        if world_up_type == "sceneUp":
-            value__ = 0
-        elif world_up_type == "objectUp":
-            value__ = 1
-        elif world_up_type == "objectRotationUp":
-            value__ = 2
-        elif world_up_type == "vector":
-            value__ = 3
-        elif world_up_type == "normal":
-            value__ = 4
-        if value__ == 1 or value__ == 2:
-            if up_vec_obj:
-                up_vec_obj.worldMatrix.connect(mpnd.worldUpMatrix, force=True)
-            else:
-                logger.log(
-                    level="error",
-                    message="You need a upvector transform",
-                    logger=_LOGGER,
+        if follow:
+            front_axis = _MOTION_PATH_AXES[aim_axes]
+            up_axis = _MOTION_PATH_AXES[up_axes]
+            world_up_type_value = _MOTION_PATH_WORLD_UP_TYPES[world_up_type]
+            if world_up_type_value in (1, 2):
+                if up_vec_obj:
+                    cmds.connectAttr(
+                        "{}.worldMatrix[0]".format(up_vec_obj),
+                        mpnd_name + ".worldUpMatrix",
+                        force=True,
+                    )
+                else:
+                    logger.log(
+                        level="error",
+                        message="You need a upvector transform",
+                        logger=_LOGGER,
+                    )
+            # The new node has the default up vector already.
+            if world_up_type_value in (2, 3) and (
+                tuple(world_up_vector) != _MOTION_PATH_DEFAULT_UP_VECTOR
+            ):
+                cmds.setAttr(
+                    "{}.worldUpVector".format(mpnd_name),
+                    *world_up_vector,
+                    type="double3"
                 )
-        if value__ == 2 or value__ == 3:
-            mpnd.worldUpVectorX.set(world_up_vector[0])
-            mpnd.worldUpVectorY.set(world_up_vector[1])
-            mpnd.worldUpVectorZ.set(world_up_vector[2])
-        mpnd.follow.set(1)
-        mpnd.frontAxis.set(value)
-        mpnd.upAxis.set(value_)
-        mpnd.worldUpType.set(value__)
-    else:
-        mpnd.follow.set(0)
-    return mpnd
+            cmds.setAttr(mpnd_name + ".follow", 1)
+            cmds.setAttr(mpnd_name + ".frontAxis", front_axis)
+            cmds.setAttr(mpnd_name + ".upAxis", up_axis)
+            cmds.setAttr(mpnd_name + ".worldUpType", world_up_type_value)
+        else:
+            cmds.setAttr(mpnd_name + ".follow", 0)
+        return pmc.PyNode(mpnd_name)
 
 
 def create_hierarchy(nodes=None, inverse_scale=None, include_parent=None):
@@ -1135,25 +1815,42 @@ def create_hierarchy(nodes=None, inverse_scale=None, include_parent=None):
     Return:
             list: The list of nodes in the hierarchy.
     """
-    temp = nodes[:]
-    for number in range(len(temp)):
-        if len(temp) > 1:
-            if not include_parent:
-                temp[-2].addChild(temp[-1])
-            else:
-                temp[-2].addChild(temp[-1].getParent())
-            temp.remove(temp[-1])
-    if inverse_scale:
-        for node in nodes:
-            if node.nodeType() == "joint":
-                node.inverseScale.disconnect()
-            else:
-                logger.log(
-                    level="error",
-                    message="Inverse scale option only" " available for joints",
-                    logger=_LOGGER,
-                )
-    return nodes
+    if not nodes:
+        return []
+    with undo_chunk("create_hierarchy"):
+        # Each node of the chain has another parent. So it is one parent
+        # command per node, but through maya.cmds instead of pymel. The chain
+        # is parented bottom up by index. So no copy of the list is needed.
+        for index in range(len(nodes) - 1, 0, -1):
+            child = nodes[index]
+            if include_parent:
+                child = child.getParent()
+            parent_node_(child, nodes[index - 1])
+        if inverse_scale:
+            # Only connected inverseScale plugs are disconnected. With
+            # disconnectAttr, so they are part of the undo chunk.
+            for node in nodes:
+                node_name = get_dag_path_(node).fullPathName()
+                if cmds.nodeType(node_name) == "joint":
+                    inverse_scale_plug = "{}.inverseScale".format(node_name)
+                    source_plugs = cmds.listConnections(
+                        inverse_scale_plug,
+                        source=True,
+                        destination=False,
+                        plugs=True,
+                    )
+                    if source_plugs:
+                        cmds.disconnectAttr(
+                            source_plugs[0], inverse_scale_plug
+                        )
+                else:
+                    logger.log(
+                        level="error",
+                        message="Inverse scale option only"
+                        " available for joints",
+                        logger=_LOGGER,
+                    )
+        return nodes
 
 
 def reduce_shape_nodes(node=None):
@@ -1164,39 +1861,68 @@ def reduce_shape_nodes(node=None):
     Return:
             List: The true shape node of the transform.
     """
-    search_pattern = "ShapeOrig|ShapeDeformed"
-    shapes = node.getShapes()
-    for shape in shapes:
-        shape.intermediateObject.set(0)
-        result = strings.search(search_pattern, str(shape))
-        pmc.delete(result)
+    shape_names = (
+        cmds.listRelatives(
+            get_dag_path_(node).fullPathName(), shapes=True, fullPath=True
+        )
+        or []
+    )
+    # The deformer shapes are deleted in one command and the intermediate
+    # object flags of the kept shapes are set in one DG modification.
+    deformer_shapes = []
+    modifier = om2.MDGModifier()
+    for shape_name in shape_names:
+        # Plain substring checks on the short name. The two names are
+        # fixed, so no regex is needed.
+        short_name = shape_name.rpartition("|")[2]
+        if "ShapeOrig" in short_name or "ShapeDeformed" in short_name:
+            deformer_shapes.append(shape_name)
+        else:
+            modifier.newPlugValueBool(
+                get_plug_("{}.intermediateObject".format(shape_name)), False
+            )
+    if deformer_shapes:
+        cmds.delete(deformer_shapes)
+    modifier.doIt()
     return node.getShapes()
 
 
-def create_joint_by_data(name, type_, side, index, matrix=None):
+def joint_name_by_data_(name, type_, side, index):
     """
-    Create a joint by data.
+    Validate the joint data and build the joint name of it.
     Args:
             name(str): Joint name.
             type_(str): Joint typ. Valid values are "BND", "DRV", "IK", "FK".
             side(str): Joint side. Valid values are "M", "R", "L".
             index(int): The index number.
-            matrix(matrix): Matrix data to snap.
     Return:
-            The new joint.
+            str: The joint name.
     """
-    valid_sides = ["L", "R", "M"]
-    valid_types = ["BND", "DRV", "FK", "IK"]
-    if side not in valid_sides:
+    if side not in _VALID_SIDES:
         raise AttributeError(
             'Chosen side is not valid. Valid values are ["L", "R", "M"]'
         )
-    if type_ not in valid_types:
+    if type_ not in _JOINT_PRESETS:
         raise AttributeError(
             "Chosen joint type is not valid. Valid values "
             'are ["BND", "DRV", "IK", "FK"]'
         )
-    name = "{}_{}_{}_{}_JNT".format(side, type_, name, str(index))
+    return "{}_{}_{}_{}_JNT".format(side, type_, name, str(index))
+
+
+def create_joint_by_data(name, type_, side, index, matrix=None):
+    """
+    Create a joint by data.
+    Args:
+            name(str): Joint name.
+            type_(str): Joint typ. Valid values are "BND", "DRV", "IK", "FK".
+            side(str): Joint side. Valid values are "M", "R", "L".
+            index(int): The index number.
+            matrix(matrix): Matrix data to snap.
+    Return:
+            The new joint.
+    """
+    name = joint_name_by_data_(name, type_, side, index)
     return create_joint(name=name, typ=type_, match_matrix=matrix)
 
 
@@ -1205,6 +1931,8 @@ def create_joint_skeleton_by_data_dic(data_list):
     Create a joint skeleton by a data dictionary.
     Args:
             data_list(list): A List filled with dictionaries.
+    Return:
+            list: The joints of the skeleton.
 
     Example:
             >>> create_joint_skeleton_by_data_dic([{'matrix': [1.0, 0.0, 0.0,
@@ -1214,17 +1942,30 @@ def create_joint_skeleton_by_data_dic(data_list):
             >>> 1.0, 0.0, 3.0, 10.0, -3.6787579514, 1.0], 'side': 'M', 'name':
             >>> 'Test', 'typ': 'DRV', 'index': 1}])
     """
-    temp = [
-        create_joint_by_data(
-            data["name"],
-            data["typ"],
-            data["side"],
-            data["index"],
-            data["matrix"],
+    # Validate all data first. So nothing is created for invalid data.
+    names = [
+        strings.string_checkup(
+            joint_name_by_data_(
+                data["name"], data["typ"], data["side"], data["index"]
+            ),
+            _LOGGER,
         )
         for data in data_list
     ]
-    create_hierarchy(temp)
+    with undo_chunk("create_joint_skeleton_by_data_dic"):
+        joints = create_joint_chain_(
+            names, [data["typ"] for data in data_list]
+        )
+        # Match the joints top down. So each parent is in place before its
+        # child is matched in world space. A joint without matrix keeps the
+        # world origin.
+        for jnt_name, data in zip(joints, data_list):
+            cmds.xform(
+                jnt_name,
+                ws=True,
+                m=list(om2.MMatrix(data.get("matrix") or om2.MMatrix())),
+            )
+        return [pmc.PyNode(jnt_name) for jnt_name in joints]
 
 
 def create_ref_transform(
@@ -1248,8 +1989,7 @@ def create_ref_transform(
     Return:
             The new ref node.
     """
-    valid_sides = ["L", "R", "M"]
-    if side not in valid_sides:
+    if side not in _VALID_SIDES:
         raise AttributeError(
             'Chosen side is not valid. Valid values are ["L", "R", "M"]'
         )
@@ -1261,7 +2001,7 @@ def create_ref_transform(
     if buffer_grp:
         create_buffer_grp(node=ref_trs)
     if child:
-        ref_trs.addChild(child)
+        parent_node_(child, ref_trs)
     return ref_trs
 
 
@@ -1497,13 +2237,13 @@ class ContainerNode(object):
             pmc.PyNode(): The connected meta node. None if not found
 
         """
-        try:
+        # Probe the attribute instead of catching the error of a missing
+        # one.
+        if self.container.hasAttr(constants.CONTAINER_META_ND_ATTR_NAME):
             self.meta_nd = self.container.attr(
                 constants.CONTAINER_META_ND_ATTR_NAME
             ).get()
             return self.meta_nd
-        except:
-            return
 
     def set_container_type(self, type):
         """
@@ -25,7 +25,9 @@
 """
 Meta node creation module.
 """
-import pymel.all as pmc
+import pymel.core as pmc
+import pymel.api as pma
+import pymel.internal.factories as factories
 import logging
 import attributes
 import re
@@ -71,7 +73,7 @@ class MetaNode(pmc.nt.Network):
         Return:
                 True if node with tag exist / False if not or tag is disable.
         """
-        fn = pmc.api.MFnDependencyNode(obj)
+        fn = pma.MFnDependencyNode(obj)
         try:
             if fn.hasAttribute(tag):
                 plug = fn.findPlug(tag)
@@ -153,7 +155,7 @@ class GodMetaNode(MetaNode):
          Return:
                  True if node with tag exist / False if not or tag is disable.
          """
-        fn = pmc.api.MFnDependencyNode(obj)
+        fn = pma.MFnDependencyNode(obj)
         try:
             if fn.hasAttribute(tag):
                 plug = fn.findPlug(tag)
@@ -250,7 +252,7 @@ class RootOpMetaNode(MetaNode):
          Return:
                  True if node with tag exist / False if not or tag is disable.
          """
-        fn = pmc.api.MFnDependencyNode(obj)
+        fn = pma.MFnDependencyNode(obj)
         try:
             if fn.hasAttribute(tag):
                 plug = fn.findPlug(tag)
@@ -465,7 +467,7 @@ class MainOpMetaNode(MetaNode):
          Return:
                  True if node with tag exist / False if not or tag is disable.
          """
-        fn = pmc.api.MFnDependencyNode(obj)
+        fn = pma.MFnDependencyNode(obj)
         try:
             if fn.hasAttribute(tag):
                 plug = fn.findPlug(tag)
@@ -752,7 +754,7 @@ class SubOpMetaNode(MetaNode):
          Return:
                  True if node with tag exist / False if not or tag is disable.
          """
-        fn = pmc.api.MFnDependencyNode(obj)
+        fn = pma.MFnDependencyNode(obj)
         try:
             if fn.hasAttribute(tag):
                 plug = fn.findPlug(tag)
@@ -920,7 +922,7 @@ class ContainerMetaNode(MetaNode):
          Return:
                  True if node with tag exist / False if not or tag is disable.
          """
-        fn = pmc.api.MFnDependencyNode(obj)
+        fn = pma.MFnDependencyNode(obj)
         try:
             if fn.hasAttribute(tag):
                 plug = fn.findPlug(tag)
@@ -1041,9 +1043,9 @@ class ContainerMetaNode(MetaNode):
         return self.attr(constants.META_CONTAINER_TYPE_ATTR).get()
 
 
-pmc.factories.registerVirtualClass(MetaNode, nameRequired=False)
-pmc.factories.registerVirtualClass(GodMetaNode, nameRequired=False)
-pmc.factories.registerVirtualClass(RootOpMetaNode, nameRequired=False)
-pmc.factories.registerVirtualClass(MainOpMetaNode, nameRequired=False)
-pmc.factories.registerVirtualClass(SubOpMetaNode, nameRequired=False)
-pmc.factories.registerVirtualClass(ContainerMetaNode, nameRequired=False)
+factories.registerVirtualClass(MetaNode, nameRequired=False)
+factories.registerVirtualClass(GodMetaNode, nameRequired=False)
+factories.registerVirtualClass(RootOpMetaNode, nameRequired=False)
+factories.registerVirtualClass(MainOpMetaNode, nameRequired=False)
+factories.registerVirtualClass(SubOpMetaNode, nameRequired=False)
+factories.registerVirtualClass(ContainerMetaNode, nameRequired=False)
@@ -41,6 +41,23 @@ import logger
 
 _LOGGER = logging.getLogger(__name__ + ".py")
 
+_VALID_SUFFIX = (
+    "_CRV|_HANDLE|_JNT|_GEO|_GRP|_CON|_MPND|_DEMAND|_MUMAND|_METAND"
+    "|_CONST|_MULDOLINND"
+)
+
+# Precompiled patterns of a string which passes all checkups unchanged.
+_SIDE_PREFIX_RE = re.compile("^[MRL]_")
+_VALID_SUFFIX_RE = re.compile(_VALID_SUFFIX)
+_COUNT_RE = re.compile(r"_\d+_")
+_UPPER_SUFFIX_RE = re.compile("_[A-Z]{1,}$")
+
+# Side characters at an invalid place of a string.
+_INVALID_SIDE_RE = re.compile(
+    "_[lrmn]+_|_[LRMN]+_|^[lrmnLRMN]_+"
+    "|_[lrmnLRMN][0-9]+_|^[0-9][lrmnLRMN]_+"
+    "|^[lrmnLRMN][0-9]_|_[0-9][lrmnLRMN]_"
+)
 
 ##########################################################
 # FUNCTIONS
@@ -81,14 +98,13 @@ def replace_invalid_prefix(string, logger_=_LOGGER):
     """
     string = str(string)
 
-    if re.match("^[MRL]_", string):
+    if _SIDE_PREFIX_RE.match(string):
         return string
-    if not re.match("^[MRL]_", string):
-        logger.log(
-            level="warning",
-            message='The string prefix "' + string + '" should specifie a side',
-            logger=logger_,
-        )
+    logger.log(
+        level="warning",
+        message='The string prefix "' + string + '" should specifie a side',
+        logger=logger_,
+    )
     numbers_match = re.match("^[0-9]", string)
     if numbers_match:
         number = "^" + numbers_match.group(0)
@@ -98,12 +114,7 @@ def replace_invalid_prefix(string, logger_=_LOGGER):
             message="Prefix contains numbers" ". Numbers deleted",
             logger=logger_,
         )
-    re_pattern = re.compile(
-        "_[lrmn]+_|_[LRMN]+_|^[lrmnLRMN]_+"
-        "|_[lrmnLRMN][0-9]+_|^[0-9][lrmnLRMN]_+"
-        "|^[lrmnLRMN][0-9]_|_[0-9][lrmnLRMN]_"
-    )
-    re_match = re.search(re_pattern, string)
+    re_match = _INVALID_SIDE_RE.search(string)
     if re_match:
         instance = re_match.group(0)
         # try to find if a number exist besides the character and remove it.
@@ -123,7 +134,7 @@ def replace_invalid_prefix(string, logger_=_LOGGER):
             string = "L{}".format(string)
         elif re.search("[MmNn]", instance):
             string = "M{}".format(string)
-        if not re.match("^[MRL]_", string):
+        if not _SIDE_PREFIX_RE.match(string):
             side = string[0]
             string = "{}_{}".format(side, string[1:])
     return string
@@ -261,19 +272,14 @@ def valid_suffix(string, logger_=_LOGGER):
     Return:
             string: The passed string.
     """
-    valid = (
-        "_CRV|_HANDLE|_JNT|_GEO|_GRP|_CON|_MPND|_DEMAND|_MUMAND|_METAND"
-        "|_CONST|_MULDOLINND"
-    )
-    suffix_pattern = re.compile(valid)
-    if not re.search(suffix_pattern, string):
+    if not _VALID_SUFFIX_RE.search(string):
         logger.log(
             level="warning",
             message='string "'
             + string
             + '" has no valid suffix.'
             + " Valid are "
-            + valid,
+            + _VALID_SUFFIX,
             logger=logger_,
         )
     return string
@@ -310,6 +316,15 @@ def string_checkup(string, logger_=_LOGGER):
     Return:
             string: The passed string.
     """
+    # A string with side prefix, count, valid and uppercase suffix passes
+    # all checkups unchanged. So the single checks are skipped for it.
+    if (
+        _SIDE_PREFIX_RE.match(string)
+        and _COUNT_RE.search(string)
+        and _VALID_SUFFIX_RE.search(string)
+        and _UPPER_SUFFIX_RE.search(string)
+    ):
+        return string
     string = valid_string_separator(string, logger_)
     string = replace_invalid_prefix(string, logger_)
     string = valid_suffix(string, logger_)